@@ -1,5 +1,4 @@
-import os
-from dotenv import load_dotenv
+from ts_arithmetic_svc.config import get_settings
 from ts_arithmetic_svc.models import Base
 from logging.config import fileConfig
 
@@ -13,9 +12,7 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-load_dotenv()
-database_url = os.getenv("DATABASE_URL")
-config.set_main_option('sqlalchemy.url', database_url)
+config.set_main_option('sqlalchemy.url', get_settings().database_url)
 
 target_metadata = Base.metadata
 
@@ -4,11 +4,12 @@ from decimal import Decimal
 from enum import Enum
 from typing import List
 
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field
 
 
-# Define constant for maximum absolute operand value
+# Define constants for the supported operand range
 MAX_ABS_OPERAND = Decimal(10) ** 10
+MIN_OPERAND = -MAX_ABS_OPERAND
 
 
 class OperationType(str, Enum):
@@ -33,6 +34,8 @@ class CalculationRequest(BaseModel):
     arithmetic calculations with high precision using Decimal types.
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     operation: OperationType = Field(
         ...,
         description="The arithmetic operation to perform"
@@ -40,14 +43,14 @@ class CalculationRequest(BaseModel):
     
     a: Decimal = Field(
         ...,
-        ge=-MAX_ABS_OPERAND,
+        ge=MIN_OPERAND,
         le=MAX_ABS_OPERAND,
         description="First operand for the calculation (range: -10^10 to 10^10)"
     )
     
     b: Decimal = Field(
         ...,
-        ge=-MAX_ABS_OPERAND, 
+        ge=MIN_OPERAND, 
         le=MAX_ABS_OPERAND,
         description="Second operand for the calculation (range: -10^10 to 10^10)"
     )
@@ -57,7 +60,8 @@ class CalculationResponse(BaseModel):
     """Response model for arithmetic calculations.
     
     Contains the calculation result along with the operation performed
-    and the input operands for verification purposes.
+    and the input operands for verification purposes. Decimal fields are
+    serialized as strings in JSON mode to maintain precision.
     """
     
     result: Decimal = Field(
@@ -74,27 +78,3 @@ class CalculationResponse(BaseModel):
         ...,
         description="List containing the input operands [a, b]"
     )
-    
-    @field_serializer('result', when_used='json')
-    def serialize_result(self, v: Decimal) -> str:
-        """Serialize result as string to maintain precision in JSON.
-        
-        Args:
-            v: The Decimal value to serialize
-            
-        Returns:
-            String representation of the Decimal value
-        """
-        return str(v)
-    
-    @field_serializer('operands', when_used='json')
-    def serialize_operands(self, v: List[Decimal]) -> List[str]:
-        """Serialize operands list as strings to maintain precision in JSON.
-        
-        Args:
-            v: List of Decimal values to serialize
-            
-        Returns:
-            List of string representations of the Decimal values
-        """
-        return [str(x) for x in v]
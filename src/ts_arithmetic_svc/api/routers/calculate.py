@@ -1,10 +1,12 @@
 """Calculate endpoint router for arithmetic operations."""
 
+import itertools
 import logging
 from typing import Dict, Callable
 from decimal import Decimal
 
 from fastapi import APIRouter, status
+from fastapi.responses import ORJSONResponse
 
 from ts_arithmetic_svc.api.models import (
     CalculationRequest,
@@ -22,62 +24,73 @@ logger = logging.getLogger(__name__)
 
 calculate_router = APIRouter()
 
+# Known calculation errors are client errors; only every Nth one logs a traceback
+_TRACE_SAMPLE_RATE = 100
+_error_counter = itertools.count()
+
+# Operation mapping from OperationType to calculator functions, built once at import
+_OPERATION_MAP: Dict[OperationType, Callable[[Decimal, Decimal], Decimal]] = {
+    OperationType.ADD: add,
+    OperationType.SUBTRACT: subtract,
+    OperationType.MULTIPLY: multiply,
+    OperationType.DIVIDE: divide,
+}
+
+
+def _should_trace() -> bool:
+    """Return True for one in every _TRACE_SAMPLE_RATE known calculation errors."""
+    return next(_error_counter) % _TRACE_SAMPLE_RATE == 0
+
 
 @calculate_router.post(
     "/calculate",
     response_model=CalculationResponse,
     status_code=status.HTTP_200_OK
 )
-async def calculate(request: CalculationRequest) -> CalculationResponse:
+async def calculate(request: CalculationRequest) -> ORJSONResponse:
     """Perform arithmetic calculation based on the request.
     
     Args:
         request: CalculationRequest containing operation type and operands
         
     Returns:
-        CalculationResponse: Result of the calculation along with operation and operands
+        ORJSONResponse: Result of the calculation along with operation and operands,
+            with Decimal values pre-rendered as strings
         
     Raises:
         DivisionByZeroError: When attempting to divide by zero
         CalculationOverflowError: When calculation result exceeds supported range
         UnsupportedOperationError: When operation type is not supported
     """
-    # Operation mapping from OperationType to calculator functions
-    # Moved inside function so it's created at runtime and picks up mocked functions
-    operation_map: Dict[OperationType, Callable[[Decimal, Decimal], Decimal]] = {
-        OperationType.ADD: add,
-        OperationType.SUBTRACT: subtract,
-        OperationType.MULTIPLY: multiply,
-        OperationType.DIVIDE: divide,
-    }
-    
     try:
         # Get the calculator function for the requested operation
-        if request.operation not in operation_map:
+        try:
+            calculator_func = _OPERATION_MAP[request.operation]
+        except KeyError:
             raise UnsupportedOperationError(
                 detail=f"Unsupported operation: {request.operation}"
-            )
-        
-        calculator_func = operation_map[request.operation]
+            ) from None
         
         # Perform the calculation
         result = calculator_func(request.a, request.b)
         
-        # Return the response
-        return CalculationResponse(
-            result=result,
-            operation=request.operation,
-            operands=[request.a, request.b]
+        # Return the response with Decimal values pre-rendered as strings
+        return ORJSONResponse(
+            content={
+                "result": str(result),
+                "operation": request.operation.value,
+                "operands": [str(request.a), str(request.b)]
+            }
         )
         
     except (DivisionByZeroError, CalculationOverflowError, UnsupportedOperationError) as e:
-        # Log the error with full traceback
-        logging.error(e, exc_info=True)
+        # Log the error, with a traceback for a sample of occurrences
+        logger.warning("Calculation error: %s", e, exc_info=_should_trace())
         # Re-raise the exception to be handled by the global exception handler
         raise
     except Exception as e:
         # Log unexpected errors
-        logging.error(f"Unexpected error in calculate endpoint: {e}", exc_info=True)
+        logger.error("Unexpected error in calculate endpoint: %s", e, exc_info=True)
         # Convert unexpected errors to UnsupportedOperationError
         raise UnsupportedOperationError(
             detail="An unexpected error occurred during calculation"
@@ -1,25 +1,74 @@
 import decimal
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 
+from ts_arithmetic_svc.api.models import CalculationRequest
+from ts_arithmetic_svc.api.routers.calculate import calculate
+from ts_arithmetic_svc.config import get_settings
 from ts_arithmetic_svc.exceptions import ArithmeticServiceError
 from ts_arithmetic_svc.routers import calculate_router
 
+# Fail at import time rather than silently running on the pure-Python _pydecimal
+# fallback, which is orders of magnitude slower
+try:
+    import _decimal  # noqa: F401
+except ImportError as e:
+    raise ImportError(
+        "ts_arithmetic_svc requires the C-accelerated decimal module (_decimal)"
+    ) from e
+
 # Set global decimal context precision for high precision arithmetic
 decimal.getcontext().prec = 28
 
+
+async def _warm_up() -> ORJSONResponse:
+    """Run one request through validation and the calculate endpoint.
+    
+    Keeps one-time initialization costs out of the first real request. Calling
+    the endpoint itself means the warm-up renders exactly the payload that real
+    requests serialize.
+    
+    Returns:
+        ORJSONResponse: The rendered response of the warm-up calculation
+    """
+    request = CalculationRequest.model_validate(
+        {"operation": "add", "a": "1", "b": "1"}
+    )
+    return await calculate(request)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Application lifespan handler that warms the calculation path on startup.
+    
+    Args:
+        app: The FastAPI application instance
+    """
+    await _warm_up()
+    yield
+
+
 app = FastAPI(
     title="Arithmetic Service API",
     description="A high-precision arithmetic service using FastAPI.",
     version="1.0.0",
-    debug=True
+    debug=get_settings().debug,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# Compress large responses only; single calculation results stay uncompressed
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 
 @app.exception_handler(ArithmeticServiceError)
 async def arithmetic_service_error_handler(
     request: Request, exc: ArithmeticServiceError
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Exception handler for ArithmeticServiceError.
     
     Args:
@@ -27,12 +76,20 @@ async def arithmetic_service_error_handler(
         exc: The ArithmeticServiceError instance
         
     Returns:
-        JSONResponse: Response with status code and detail from the exception
+        ORJSONResponse: Response with status code and detail from the exception
     """
-    return JSONResponse(
+    response = ORJSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail}
     )
+    # Shared instances such as DIVISION_BY_ZERO outlive the request; drop the
+    # traceback and any chained exception so they do not keep the failed
+    # request's frames alive. Assigning __cause__ sets __suppress_context__,
+    # so restore its default as well.
+    exc.__traceback__ = None
+    exc.__context__ = exc.__cause__ = None
+    exc.__suppress_context__ = False
+    return response
 
 
 @app.get("/")
@@ -1,7 +1,51 @@
-import os
-from dotenv import load_dotenv
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
 
-load_dotenv()
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///:memory:")
-SERVICE_PORT = os.getenv("SERVICE_PORT", 8000)
\ No newline at end of file
+
+def _find_env_file(start: Path | None = None) -> Path | str:
+    """Return the ``.env`` file to load, preferring the working directory.
+
+    When the working directory has no ``.env``, fall back to the one in the
+    project root: the first directory above ``start`` (this module by default)
+    containing ``pyproject.toml``. The search never goes past that root, so an
+    installed package does not pick up stray ``.env`` files from its parents.
+    """
+    if Path(".env").is_file():
+        return ".env"
+    for directory in Path(start or __file__).resolve().parents:
+        if (directory / "pyproject.toml").is_file():
+            candidate = directory / ".env"
+            if candidate.is_file():
+                return candidate
+            break
+    return ".env"
+
+
+class Settings(BaseSettings):
+    """Service configuration read from environment variables and the ``.env`` file.
+
+    A ``.env`` in the working directory takes precedence; otherwise the one in the
+    project root is used, so the service also finds it when started elsewhere.
+    """
+
+    model_config = SettingsConfigDict(env_file=_find_env_file(), extra="ignore")
+
+    database_url: str = "sqlite:///:memory:"
+    service_port: int = 8000
+    debug: bool = False
+
+    @field_validator("debug", mode="before")
+    @classmethod
+    def parse_debug(cls, value: Any) -> bool:
+        """Enable debug only for a case-insensitive ``true``; any other value disables it."""
+        return str(value).lower() == "true"
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance, parsed on first use."""
+    return Settings()
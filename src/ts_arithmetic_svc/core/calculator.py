@@ -7,8 +7,22 @@ and division-by-zero handling.
 
 from decimal import Decimal
 
-from ts_arithmetic_svc.exceptions import DivisionByZeroError, CalculationOverflowError
-from ts_arithmetic_svc.api.models import MAX_ABS_OPERAND
+from ts_arithmetic_svc.exceptions import DIVISION_BY_ZERO, OVERFLOW
+from ts_arithmetic_svc.api.models import MAX_ABS_OPERAND, MIN_OPERAND
+
+# Exponent of the most significant digit of MAX_ABS_OPERAND. Any finite result
+# whose adjusted() is below this is strictly inside the bounds, so the exact
+# range comparison only runs for results of the same magnitude as the limit.
+# Infinity and NaN report adjusted() == 0 and must always take the comparison.
+_MAX_ADJUSTED = MAX_ABS_OPERAND.adjusted()
+
+
+def _check_range(result: Decimal) -> None:
+    """Raise OVERFLOW if result is outside [MIN_OPERAND, MAX_ABS_OPERAND]."""
+    if (
+        not result.is_finite() or result.adjusted() >= _MAX_ADJUSTED
+    ) and not MIN_OPERAND <= result <= MAX_ABS_OPERAND:
+        raise OVERFLOW.with_traceback(None)
 
 
 def add(a: Decimal, b: Decimal) -> Decimal:
@@ -22,11 +36,10 @@ def add(a: Decimal, b: Decimal) -> Decimal:
         Decimal: Sum of a and b
         
     Raises:
-        CalculationOverflowError: If result exceeds MAX_ABS_OPERAND range
+        CalculationOverflowError: If result is outside [MIN_OPERAND, MAX_ABS_OPERAND]
     """
     result = a + b
-    if abs(result) > MAX_ABS_OPERAND:
-        raise CalculationOverflowError(detail="Calculation result exceeds supported range")
+    _check_range(result)
     return result
 
 
@@ -41,11 +54,10 @@ def subtract(a: Decimal, b: Decimal) -> Decimal:
         Decimal: Difference of a and b
         
     Raises:
-        CalculationOverflowError: If result exceeds MAX_ABS_OPERAND range
+        CalculationOverflowError: If result is outside [MIN_OPERAND, MAX_ABS_OPERAND]
     """
     result = a - b
-    if abs(result) > MAX_ABS_OPERAND:
-        raise CalculationOverflowError(detail="Calculation result exceeds supported range")
+    _check_range(result)
     return result
 
 
@@ -60,11 +72,10 @@ def multiply(a: Decimal, b: Decimal) -> Decimal:
         Decimal: Product of a and b
         
     Raises:
-        CalculationOverflowError: If result exceeds MAX_ABS_OPERAND range
+        CalculationOverflowError: If result is outside [MIN_OPERAND, MAX_ABS_OPERAND]
     """
     result = a * b
-    if abs(result) > MAX_ABS_OPERAND:
-        raise CalculationOverflowError(detail="Calculation result exceeds supported range")
+    _check_range(result)
     return result
 
 
@@ -80,12 +91,12 @@ def divide(a: Decimal, b: Decimal) -> Decimal:
         
     Raises:
         DivisionByZeroError: If b is exactly zero
-        CalculationOverflowError: If result exceeds MAX_ABS_OPERAND range
+        CalculationOverflowError: If result is outside [MIN_OPERAND, MAX_ABS_OPERAND]
     """
-    if b == Decimal(0):
-        raise DivisionByZeroError(detail="Division by zero is not allowed")
+    # A Decimal is falsy exactly when it is zero (including -0 and 0.000)
+    if not b:
+        raise DIVISION_BY_ZERO.with_traceback(None)
     
     result = a / b
-    if abs(result) > MAX_ABS_OPERAND:
-        raise CalculationOverflowError(detail="Calculation result exceeds supported range")
+    _check_range(result)
     return result
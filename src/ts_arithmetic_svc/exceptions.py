@@ -48,9 +48,23 @@ class UnsupportedOperationError(ArithmeticServiceError):
     detail = "Unsupported operation"
 
 
+# Shared instances carrying the default detail, reused on hot error paths.
+# Raise them as ``raise DIVISION_BY_ZERO.with_traceback(None)`` so the
+# traceback does not keep growing across raises; the app's exception handler
+# clears it, along with any chained __context__/__cause__, once the response
+# is built.
+# Sharing relies on every raise happening on the event loop thread (the
+# calculate endpoint is ``async def``). Raising them from threadpool code
+# would let concurrent requests race on ``__traceback__``.
+DIVISION_BY_ZERO = DivisionByZeroError()
+OVERFLOW = CalculationOverflowError()
+
+
 __all__ = [
     "ArithmeticServiceError",
     "DivisionByZeroError",
     "CalculationOverflowError",
-    "UnsupportedOperationError"
+    "UnsupportedOperationError",
+    "DIVISION_BY_ZERO",
+    "OVERFLOW"
 ]
@@ -1,20 +1,29 @@
 import logging
+import os
 
 import uvicorn
-from ts_arithmetic_svc.app import app
-from ts_arithmetic_svc.config import SERVICE_PORT
-
+from ts_arithmetic_svc.config import get_settings
 
 # Set up logging for the application
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
 
 def main():
-    service_port = int(SERVICE_PORT)
-    uvicorn.run(app, host="0.0.0.0", port=service_port)
+    service_port = get_settings().service_port
+    # The import string form lets uvicorn pre-fork one worker per core
+    uvicorn.run(
+        "ts_arithmetic_svc.app:app",
+        host="0.0.0.0",
+        port=service_port,
+        # "auto" picks uvloop/httptools when installed, else asyncio/h11
+        loop="auto",
+        http="auto",
+        workers=os.cpu_count(),
+        log_level="warning"
+    )
 
 
 if __name__ == "__main__":
     # Entry point for the application
-    main()
\ No newline at end of file
+    main()
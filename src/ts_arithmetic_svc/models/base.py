@@ -3,11 +3,11 @@ from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import scoped_session, sessionmaker, Session
 
-from ts_arithmetic_svc.config import DATABASE_URL
+from ts_arithmetic_svc.config import get_settings
 
 Base = declarative_base()
 
-engine = create_engine(DATABASE_URL)
+engine = create_engine(get_settings().database_url)
 SessionLocal = sessionmaker(bind=engine)
 
 
@@ -1,7 +1,6 @@
 """Unit tests for API Pydantic models."""
 
 from decimal import Decimal
-from typing import Any, Dict, List
 
 import pytest
 from pydantic import ValidationError
@@ -11,6 +10,7 @@ from ts_arithmetic_svc.api.models import (
     CalculationResponse,
     OperationType,
     MAX_ABS_OPERAND,
+    MIN_OPERAND,
 )
 
 
@@ -199,6 +199,15 @@ class TestCalculationRequest:
         assert isinstance(request.a, Decimal)
         assert isinstance(request.b, Decimal)
 
+    def test_calculation_request_is_frozen(self) -> None:
+        """Test that CalculationRequest instances are immutable."""
+        request = CalculationRequest(
+            operation=OperationType.ADD, a=Decimal("1"), b=Decimal("2")
+        )
+        
+        with pytest.raises(ValidationError):
+            request.a = Decimal("3")  # type: ignore[misc]
+
     def test_calculation_request_missing_fields(self) -> None:
         """Test that missing required fields raise ValidationError."""
         with pytest.raises(ValidationError) as exc_info:
@@ -368,6 +377,18 @@ class TestModelIntegration:
         assert "3.14" in json_output
         assert "2.86" in json_output
 
+    def test_min_operand_constant(self) -> None:
+        """Test that MIN_OPERAND is the negated MAX_ABS_OPERAND bound."""
+        assert MIN_OPERAND == -MAX_ABS_OPERAND
+        
+        # Verify the lower bound itself is accepted
+        request = CalculationRequest(
+            operation=OperationType.ADD,
+            a=MIN_OPERAND,
+            b=Decimal("1")
+        )
+        assert request.a == MIN_OPERAND
+
     def test_max_abs_operand_constant(self) -> None:
         """Test that MAX_ABS_OPERAND constant is correctly defined."""
         assert MAX_ABS_OPERAND == Decimal("10000000000")  # 10^10
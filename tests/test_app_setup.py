@@ -2,10 +2,9 @@
 
 import decimal
 
-import pytest
 from fastapi.testclient import TestClient
 
-from ts_arithmetic_svc.app import app
+from ts_arithmetic_svc.app import _warm_up, app
 
 
 class TestAppSetup:
@@ -48,8 +47,75 @@ class TestAppSetup:
         current_precision = decimal.getcontext().prec
         assert current_precision >= 28, f"Expected precision >= 28, got {current_precision}"
 
+    def test_decimal_uses_c_implementation(self) -> None:
+        """Test that the decimal module is backed by the C _decimal implementation."""
+        import _decimal
+        
+        assert decimal.Decimal is _decimal.Decimal
+
     def test_fastapi_metadata(self) -> None:
         """Test that FastAPI application metadata matches specified values."""
         assert app.title == "Arithmetic Service API"
         assert app.description == "A high-precision arithmetic service using FastAPI."
         assert app.version == "1.0.0"
+
+    def test_default_response_class_is_orjson(self) -> None:
+        """Test that the application renders responses with ORJSONResponse."""
+        from fastapi.responses import ORJSONResponse
+
+        assert app.router.default_response_class is ORJSONResponse
+
+    def test_debug_mode_follows_config(self) -> None:
+        """Test that debug mode is taken from configuration rather than hard-coded."""
+        from ts_arithmetic_svc.config import get_settings
+
+        assert app.debug is get_settings().debug
+
+    def test_gzip_middleware_configured(self) -> None:
+        """Test that GZip compression is enabled with a 1 KiB threshold."""
+        from fastapi.middleware.gzip import GZipMiddleware
+
+        gzip_middleware = [m for m in app.user_middleware if m.cls is GZipMiddleware]
+        assert len(gzip_middleware) == 1
+        assert gzip_middleware[0].kwargs["minimum_size"] == 1024
+
+    def test_small_responses_are_not_compressed(self, client: TestClient) -> None:
+        """Test that responses below the GZip threshold are sent uncompressed.
+        
+        Args:
+            client: TestClient fixture from conftest.py
+        """
+        response = client.post(
+            "/calculate",
+            json={"operation": "add", "a": "1", "b": "2"},
+            headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+
+    def test_startup_warms_calculation_path(self) -> None:
+        """Test that application startup runs the calculation warm-up once."""
+        from unittest.mock import patch
+
+        with patch("ts_arithmetic_svc.app._warm_up") as mock_warm_up:
+            with TestClient(app):
+                pass
+        mock_warm_up.assert_called_once_with()
+
+    def test_warm_up_renders_calculate_payload(self) -> None:
+        """Test that the warm-up goes through the calculate endpoint's serializer."""
+        import asyncio
+        import json
+        from unittest.mock import patch
+
+        from ts_arithmetic_svc.api.routers.calculate import calculate
+
+        with patch("ts_arithmetic_svc.app.calculate", wraps=calculate) as mock_calculate:
+            response = asyncio.run(_warm_up())
+
+        mock_calculate.assert_awaited_once()
+        assert json.loads(response.body) == {
+            "result": "2",
+            "operation": "add",
+            "operands": ["1", "1"]
+        }
@@ -1,16 +1,20 @@
 """Unit tests for the calculate router endpoint."""
 
+import itertools
+import logging
+
 import pytest
 from decimal import Decimal
 from fastapi.testclient import TestClient
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from ts_arithmetic_svc.api.models import OperationType
-from ts_arithmetic_svc.exceptions import (
-    DivisionByZeroError,
-    CalculationOverflowError,
-    UnsupportedOperationError
+from ts_arithmetic_svc.api.routers.calculate import (
+    _OPERATION_MAP,
+    _TRACE_SAMPLE_RATE,
+    _should_trace
 )
+from ts_arithmetic_svc.exceptions import CalculationOverflowError
 
 
 class TestCalculateRouter:
@@ -114,16 +118,14 @@ class TestCalculateRouter:
         response_data = response.json()
         assert response_data["detail"] == "Division by zero is not allowed"
 
-    @patch('ts_arithmetic_svc.api.routers.calculate.add')
-    def test_calculate_overflow_error(self, mock_add, client: TestClient) -> None:
+    def test_calculate_overflow_error(self, client: TestClient) -> None:
         """Test calculation overflow error handling.
         
         Args:
-            mock_add: Mock for the add function
             client: TestClient fixture from conftest.py
         """
         # Mock the add function to raise CalculationOverflowError
-        mock_add.side_effect = CalculationOverflowError()
+        mock_add = Mock(side_effect=CalculationOverflowError())
         
         request_data = {
             "operation": "add",
@@ -131,7 +133,8 @@ class TestCalculateRouter:
             "b": "1.0"
         }
         
-        response = client.post("/calculate", json=request_data)
+        with patch.dict(_OPERATION_MAP, {OperationType.ADD: mock_add}):
+            response = client.post("/calculate", json=request_data)
         
         assert response.status_code == 400
         response_data = response.json()
@@ -246,16 +249,14 @@ class TestCalculateRouter:
         assert response_data["operation"] == "multiply"
         assert response_data["operands"] == ["0.0", "5.25"]
 
-    @patch('ts_arithmetic_svc.api.routers.calculate.add')
-    def test_calculate_unexpected_error(self, mock_add, client: TestClient) -> None:
+    def test_calculate_unexpected_error(self, client: TestClient) -> None:
         """Test unexpected error handling.
         
         Args:
-            mock_add: Mock for the add function
             client: TestClient fixture from conftest.py
         """
         # Mock the add function to raise an unexpected error
-        mock_add.side_effect = RuntimeError("Unexpected error")
+        mock_add = Mock(side_effect=RuntimeError("Unexpected error"))
         
         request_data = {
             "operation": "add",
@@ -263,7 +264,8 @@ class TestCalculateRouter:
             "b": "1.0"
         }
         
-        response = client.post("/calculate", json=request_data)
+        with patch.dict(_OPERATION_MAP, {OperationType.ADD: mock_add}):
+            response = client.post("/calculate", json=request_data)
         
         assert response.status_code == 400
         response_data = response.json()
@@ -291,3 +293,56 @@ class TestCalculateRouter:
         assert response_data["result"] == expected_result
         assert response_data["operation"] == "add"
         assert response_data["operands"] == ["1.123456789012345678901234567890", "2.987654321098765432109876543210"]
+
+    def test_calculate_operation_missing_from_dispatch(self, client: TestClient) -> None:
+        """Test that an operation without a calculator function is reported as unsupported.
+        
+        Args:
+            client: TestClient fixture from conftest.py
+        """
+        request_data = {
+            "operation": "add",
+            "a": "1.0",
+            "b": "1.0"
+        }
+        
+        with patch.dict(_OPERATION_MAP):
+            del _OPERATION_MAP[OperationType.ADD]
+            response = client.post("/calculate", json=request_data)
+        
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Unsupported operation: OperationType.ADD"
+
+    def test_known_errors_log_sampled_tracebacks(self) -> None:
+        """Test that only one in every _TRACE_SAMPLE_RATE known errors requests a traceback."""
+        with patch(
+            'ts_arithmetic_svc.api.routers.calculate._error_counter',
+            itertools.count()
+        ):
+            samples = [_should_trace() for _ in range(2 * _TRACE_SAMPLE_RATE)]
+        
+        assert samples.count(True) == 2
+        assert samples[0] and samples[_TRACE_SAMPLE_RATE]
+
+    def test_known_error_logged_as_warning(
+        self, client: TestClient, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test that known calculation errors are logged at WARNING level.
+        
+        Args:
+            client: TestClient fixture from conftest.py
+            caplog: pytest log capture fixture
+        """
+        request_data = {
+            "operation": "divide",
+            "a": "1",
+            "b": "0"
+        }
+        
+        with caplog.at_level(logging.WARNING, logger="ts_arithmetic_svc.api.routers.calculate"):
+            response = client.post("/calculate", json=request_data)
+        
+        assert response.status_code == 400
+        records = [r for r in caplog.records if r.name == "ts_arithmetic_svc.api.routers.calculate"]
+        assert len(records) == 1
+        assert records[0].levelno == logging.WARNING
@@ -9,74 +9,85 @@ This module contains comprehensive tests for the calculator functions including:
 """
 
 import pytest
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 
 from ts_arithmetic_svc.core.calculator import add, subtract, multiply, divide
 from ts_arithmetic_svc.exceptions import DivisionByZeroError, CalculationOverflowError
 from ts_arithmetic_svc.api.models import MAX_ABS_OPERAND
 
+# Operand/expected tables for TestBasicOperations, built once at import
+_ADD_CASES = (
+    (Decimal('10'), Decimal('5'), Decimal('15')),
+    (Decimal('-10'), Decimal('5'), Decimal('-5')),
+    (Decimal('10'), Decimal('-5'), Decimal('5')),
+    (Decimal('-10'), Decimal('-5'), Decimal('-15')),
+    (Decimal('0'), Decimal('0'), Decimal('0')),
+    (Decimal('0'), Decimal('100'), Decimal('100')),
+    (Decimal('100'), Decimal('0'), Decimal('100')),
+    (Decimal('123.456'), Decimal('789.012'), Decimal('912.468')),
+)
+
+_SUB_CASES = (
+    (Decimal('10'), Decimal('5'), Decimal('5')),
+    (Decimal('-10'), Decimal('5'), Decimal('-15')),
+    (Decimal('10'), Decimal('-5'), Decimal('15')),
+    (Decimal('-10'), Decimal('-5'), Decimal('-5')),
+    (Decimal('0'), Decimal('0'), Decimal('0')),
+    (Decimal('0'), Decimal('100'), Decimal('-100')),
+    (Decimal('100'), Decimal('0'), Decimal('100')),
+    (Decimal('789.012'), Decimal('123.456'), Decimal('665.556')),
+)
+
+_MUL_CASES = (
+    (Decimal('10'), Decimal('5'), Decimal('50')),
+    (Decimal('-10'), Decimal('5'), Decimal('-50')),
+    (Decimal('10'), Decimal('-5'), Decimal('-50')),
+    (Decimal('-10'), Decimal('-5'), Decimal('50')),
+    (Decimal('0'), Decimal('100'), Decimal('0')),
+    (Decimal('100'), Decimal('0'), Decimal('0')),
+    (Decimal('1.5'), Decimal('2.5'), Decimal('3.75')),
+    (Decimal('12.34'), Decimal('5.67'), Decimal('69.9678')),
+)
+
+_DIV_CASES = (
+    (Decimal('10'), Decimal('5'), Decimal('2')),
+    (Decimal('-10'), Decimal('5'), Decimal('-2')),
+    (Decimal('10'), Decimal('-5'), Decimal('-2')),
+    (Decimal('-10'), Decimal('-5'), Decimal('2')),
+    (Decimal('0'), Decimal('100'), Decimal('0')),
+    (Decimal('15'), Decimal('3'), Decimal('5')),
+    (Decimal('7.5'), Decimal('2.5'), Decimal('3')),
+    (Decimal('22'), Decimal('7'), Decimal('3.142857142857142857142857143')),
+    (Decimal('123.45'), Decimal('100'), Decimal('1.2345')),
+    (Decimal('-500'), Decimal('100'), Decimal('-5')),
+)
+
 
 class TestBasicOperations:
     """Test basic arithmetic operations with various input combinations."""
     
-    @pytest.mark.parametrize("a, b, expected", [
-        (Decimal('10'), Decimal('5'), Decimal('15')),
-        (Decimal('-10'), Decimal('5'), Decimal('-5')),
-        (Decimal('10'), Decimal('-5'), Decimal('5')),
-        (Decimal('-10'), Decimal('-5'), Decimal('-15')),
-        (Decimal('0'), Decimal('0'), Decimal('0')),
-        (Decimal('0'), Decimal('100'), Decimal('100')),
-        (Decimal('100'), Decimal('0'), Decimal('100')),
-        (Decimal('123.456'), Decimal('789.012'), Decimal('912.468')),
-    ])
+    @pytest.mark.parametrize("a, b, expected", _ADD_CASES)
     def test_add(self, a, b, expected):
         """Test addition with various decimal inputs."""
         result = add(a, b)
         assert result == expected
         assert isinstance(result, Decimal)
     
-    @pytest.mark.parametrize("a, b, expected", [
-        (Decimal('10'), Decimal('5'), Decimal('5')),
-        (Decimal('-10'), Decimal('5'), Decimal('-15')),
-        (Decimal('10'), Decimal('-5'), Decimal('15')),
-        (Decimal('-10'), Decimal('-5'), Decimal('-5')),
-        (Decimal('0'), Decimal('0'), Decimal('0')),
-        (Decimal('0'), Decimal('100'), Decimal('-100')),
-        (Decimal('100'), Decimal('0'), Decimal('100')),
-        (Decimal('789.012'), Decimal('123.456'), Decimal('665.556')),
-    ])
+    @pytest.mark.parametrize("a, b, expected", _SUB_CASES)
     def test_subtract(self, a, b, expected):
         """Test subtraction with various decimal inputs."""
         result = subtract(a, b)
         assert result == expected
         assert isinstance(result, Decimal)
     
-    @pytest.mark.parametrize("a, b, expected", [
-        (Decimal('10'), Decimal('5'), Decimal('50')),
-        (Decimal('-10'), Decimal('5'), Decimal('-50')),
-        (Decimal('10'), Decimal('-5'), Decimal('-50')),
-        (Decimal('-10'), Decimal('-5'), Decimal('50')),
-        (Decimal('0'), Decimal('100'), Decimal('0')),
-        (Decimal('100'), Decimal('0'), Decimal('0')),
-        (Decimal('1.5'), Decimal('2.5'), Decimal('3.75')),
-        (Decimal('12.34'), Decimal('5.67'), Decimal('69.9678')),
-    ])
+    @pytest.mark.parametrize("a, b, expected", _MUL_CASES)
     def test_multiply(self, a, b, expected):
         """Test multiplication with various decimal inputs."""
         result = multiply(a, b)
         assert result == expected
         assert isinstance(result, Decimal)
     
-    @pytest.mark.parametrize("a, b, expected", [
-        (Decimal('10'), Decimal('5'), Decimal('2')),
-        (Decimal('-10'), Decimal('5'), Decimal('-2')),
-        (Decimal('10'), Decimal('-5'), Decimal('-2')),
-        (Decimal('-10'), Decimal('-5'), Decimal('2')),
-        (Decimal('0'), Decimal('100'), Decimal('0')),
-        (Decimal('15'), Decimal('3'), Decimal('5')),
-        (Decimal('7.5'), Decimal('2.5'), Decimal('3')),
-        (Decimal('22'), Decimal('7'), Decimal('3.142857142857142857142857143')),
-    ])
+    @pytest.mark.parametrize("a, b, expected", _DIV_CASES)
     def test_divide(self, a, b, expected):
         """Test division with various decimal inputs."""
         result = divide(a, b)
@@ -113,6 +124,17 @@ class TestDecimalPrecision:
         expected = Decimal('0.3333333333333333333333333333')
         assert result == expected
         assert str(result).count('3') > 10  # Verify high precision
+    
+    def test_result_scale_follows_operands(self):
+        """Test that equal-valued operands with different scales give differently scaled results."""
+        assert str(add(Decimal('1.0'), Decimal('2'))) == '3.0'
+        assert str(add(Decimal('1'), Decimal('2'))) == '3'
+        assert str(multiply(Decimal('4.0'), Decimal('2.5'))) == '10.00'
+        assert str(multiply(Decimal('4'), Decimal('2.5'))) == '10.0'
+        assert str(multiply(Decimal('0.0'), Decimal('5.25'))) == '0.000'
+        assert str(divide(Decimal('0.00'), Decimal('4'))) == '0.00'
+        assert str(divide(Decimal('500'), Decimal('100'))) == '5'
+        assert str(divide(Decimal('123.45'), Decimal('100'))) == '1.2345'
 
 
 class TestDivisionByZero:
@@ -141,6 +163,24 @@ class TestDivisionByZero:
         with pytest.raises(DivisionByZeroError) as exc_info:
             divide(Decimal('5'), Decimal('0.0'))
         assert exc_info.value.detail == "Division by zero is not allowed"
+    
+    def test_divide_by_negative_zero(self):
+        """Test division by negative zero."""
+        with pytest.raises(DivisionByZeroError) as exc_info:
+            divide(Decimal('5'), Decimal('-0.00'))
+        assert exc_info.value.detail == "Division by zero is not allowed"
+    
+    def test_repeated_raises_do_not_accumulate_traceback(self):
+        """Test that reraising the shared error instance starts a fresh traceback."""
+        depths = []
+        for _ in range(3):
+            with pytest.raises(DivisionByZeroError) as exc_info:
+                divide(Decimal('1'), Decimal('0'))
+            depth, tb = 0, exc_info.value.__traceback__
+            while tb is not None:
+                depth, tb = depth + 1, tb.tb_next
+            depths.append(depth)
+        assert depths[0] == depths[1] == depths[2]
 
 
 class TestCalculationOverflow:
@@ -203,6 +243,24 @@ class TestCalculationOverflow:
         with pytest.raises(CalculationOverflowError) as exc_info:
             divide(MAX_ABS_OPERAND, small_negative_divisor)
         assert exc_info.value.detail == "Calculation result exceeds supported range"
+    
+    @pytest.mark.parametrize("func, a, b", [
+        (add, Decimal('Infinity'), Decimal('1')),
+        (add, Decimal('-Infinity'), Decimal('1')),
+        (subtract, Decimal('-Infinity'), Decimal('1')),
+        (multiply, Decimal('Infinity'), Decimal('2')),
+        (divide, Decimal('-Infinity'), Decimal('2')),
+    ])
+    def test_infinite_result_overflows(self, func, a, b):
+        """Test that an infinite result is reported as overflow, not returned."""
+        with pytest.raises(CalculationOverflowError):
+            func(a, b)
+    
+    @pytest.mark.parametrize("func", [add, subtract, multiply, divide])
+    def test_nan_operand_is_rejected(self, func):
+        """Test that a NaN operand raises instead of returning NaN."""
+        with pytest.raises(InvalidOperation):
+            func(Decimal('NaN'), Decimal('1'))
 
 
 class TestBoundaryConditions:
@@ -255,6 +313,16 @@ class TestBoundaryConditions:
         result = divide(MAX_ABS_OPERAND, Decimal('-1'))
         assert result == -MAX_ABS_OPERAND
         assert isinstance(result, Decimal)
+    
+    def test_same_magnitude_as_boundary(self):
+        """Test results with the boundary's magnitude on either side of the limit."""
+        assert add(Decimal('9999999999.5'), Decimal('0.5')) == MAX_ABS_OPERAND
+        assert subtract(Decimal('-9999999999.5'), Decimal('0.5')) == -MAX_ABS_OPERAND
+        assert multiply(Decimal('1.0E+10'), Decimal('1.00')) == MAX_ABS_OPERAND
+        with pytest.raises(CalculationOverflowError):
+            add(MAX_ABS_OPERAND, Decimal('0.0000001'))
+        with pytest.raises(CalculationOverflowError):
+            subtract(-MAX_ABS_OPERAND, Decimal('0.0000001'))
 
 
 class TestEdgeCases:
@@ -310,3 +378,10 @@ class TestEdgeCases:
         assert subtract(test_value, Decimal('0')) == test_value
         assert multiply(test_value, Decimal('1')) == test_value
         assert divide(test_value, Decimal('1')) == test_value
+    
+    def test_identity_operands_keep_scale(self):
+        """Test that zero and one operands still contribute their scale to the result."""
+        assert str(add(Decimal('1.5'), Decimal('0.00'))) == '1.50'
+        assert str(subtract(Decimal('1.5'), Decimal('0.00'))) == '1.50'
+        assert str(multiply(Decimal('2.5'), Decimal('1.00'))) == '2.500'
+        assert str(multiply(Decimal('0'), Decimal('2.5'))) == '0.0'
@@ -0,0 +1,100 @@
+"""Unit tests for service configuration."""
+
+from pathlib import Path
+
+import pytest
+
+from ts_arithmetic_svc.config import Settings, _find_env_file, get_settings
+
+
+class TestSettings:
+    """Test cases for the Settings model and its cached accessor."""
+
+    def test_defaults(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test default values when no environment variables are set."""
+        for name in ("DATABASE_URL", "SERVICE_PORT", "DEBUG"):
+            monkeypatch.delenv(name, raising=False)
+
+        settings = Settings(_env_file=None)
+
+        assert settings.database_url == "sqlite:///:memory:"
+        assert settings.service_port == 8000
+        assert settings.debug is False
+
+    def test_environment_overrides(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that environment variables override defaults and are typed."""
+        monkeypatch.setenv("DATABASE_URL", "sqlite:///test.db")
+        monkeypatch.setenv("SERVICE_PORT", "9000")
+        monkeypatch.setenv("DEBUG", "true")
+
+        settings = Settings(_env_file=None)
+
+        assert settings.database_url == "sqlite:///test.db"
+        assert settings.service_port == 9000
+        assert settings.debug is True
+
+    @pytest.mark.parametrize("value, expected", [
+        ("true", True),
+        ("TRUE", True),
+        ("false", False),
+        ("1", False),
+        ("yes", False),
+        ("release", False),
+    ])
+    def test_debug_only_enabled_by_true(
+        self, monkeypatch: pytest.MonkeyPatch, value: str, expected: bool
+    ) -> None:
+        """Test that only a case-insensitive "true" enables debug and other values never fail."""
+        monkeypatch.setenv("DEBUG", value)
+
+        assert Settings(_env_file=None).debug is expected
+
+    def test_env_file_found_in_project_root(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the project root .env is found when the working directory has none."""
+        project = tmp_path / "project"
+        module = project / "src" / "pkg" / "config.py"
+        module.parent.mkdir(parents=True)
+        (project / "pyproject.toml").touch()
+        (project / ".env").touch()
+        workdir = tmp_path / "workdir"
+        workdir.mkdir()
+        monkeypatch.chdir(workdir)
+
+        assert _find_env_file(module) == project / ".env"
+
+    def test_env_file_prefers_working_directory(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a .env in the working directory wins over the project root one."""
+        project = tmp_path / "project"
+        module = project / "src" / "pkg" / "config.py"
+        module.parent.mkdir(parents=True)
+        (project / "pyproject.toml").touch()
+        (project / ".env").touch()
+        workdir = tmp_path / "workdir"
+        workdir.mkdir()
+        (workdir / ".env").touch()
+        monkeypatch.chdir(workdir)
+
+        assert _find_env_file(module) == ".env"
+
+    def test_env_file_search_stops_at_project_root(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that .env files above the project root are ignored in favour of the fallback."""
+        (tmp_path / ".env").touch()
+        project = tmp_path / "project"
+        module = project / "src" / "pkg" / "config.py"
+        module.parent.mkdir(parents=True)
+        (project / "pyproject.toml").touch()
+        workdir = project / "workdir"
+        workdir.mkdir()
+        monkeypatch.chdir(workdir)
+
+        assert _find_env_file(module) == ".env"
+
+    def test_get_settings_is_cached(self) -> None:
+        """Test that get_settings returns the same instance on every call."""
+        assert get_settings() is get_settings()
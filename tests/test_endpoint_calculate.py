@@ -10,39 +10,93 @@ This module contains comprehensive tests covering:
 - Concurrency testing for robust parallel request handling
 """
 
-import json
-import concurrent.futures
+import asyncio
+import operator
 from decimal import Decimal
-from typing import Dict, Any, List
+from typing import Any, Dict, List
 
+import httpx
 import pytest
-from fastapi import status
+from fastapi import Request, status
 from fastapi.testclient import TestClient
 
 from ts_arithmetic_svc.api.models import (
-    OperationType,
-    CalculationRequest, 
     CalculationResponse,
     MAX_ABS_OPERAND
 )
 from ts_arithmetic_svc.app import app
+from ts_arithmetic_svc.exceptions import (
+    ArithmeticServiceError,
+    DIVISION_BY_ZERO,
+    DivisionByZeroError
+)
+
+# Operand strings at and just outside the supported range
+_MAX_STR = str(MAX_ABS_OPERAND)
+_OVER_MAX_STR = str(MAX_ABS_OPERAND + 1)
+_UNDER_MIN_STR = str(-MAX_ABS_OPERAND - 1)
+
+# Decimal operator for each operation name, used to compute expected results
+_OPERATORS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+}
+
+
+def _index_errors(detail: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Index 422 validation errors by the name of the field they refer to."""
+    return {error["loc"][-1]: error for error in detail}
+
+
+# Valid requests (no division by zero or overflow) for the concurrency test
+_SCENARIOS = (
+    {"operation": "add", "a": "10.5", "b": "5.25"},
+    {"operation": "subtract", "a": "20.0", "b": "8.5"},
+    {"operation": "multiply", "a": "3.5", "b": "4.0"},
+    {"operation": "divide", "a": "15.0", "b": "3.0"},
+    {"operation": "add", "a": "100.123", "b": "200.456"},
+    {"operation": "subtract", "a": "500.0", "b": "250.75"},
+    {"operation": "multiply", "a": "7.5", "b": "8.0"},
+    {"operation": "divide", "a": "24.0", "b": "6.0"},
+    {"operation": "add", "a": "0.1", "b": "0.2"},
+    {"operation": "subtract", "a": "1.0", "b": "0.9"},
+    {"operation": "multiply", "a": "12.5", "b": "2.5"},
+    {"operation": "divide", "a": "50.0", "b": "10.0"},
+    {"operation": "add", "a": "-5.5", "b": "3.25"},
+    {"operation": "subtract", "a": "-10.0", "b": "-5.0"},
+    {"operation": "multiply", "a": "-2.5", "b": "4.0"},
+    {"operation": "divide", "a": "-20.0", "b": "-4.0"},
+    {"operation": "add", "a": "999.999", "b": "0.001"},
+    {"operation": "subtract", "a": "1000.0", "b": "999.999"},
+    {"operation": "multiply", "a": "1.5", "b": "1.5"},
+    {"operation": "divide", "a": "9.0", "b": "3.0"},
+)
 
 
 class TestCalculateEndpointSuccess:
     """Test successful calculation scenarios for all operations."""
 
-    def test_calculate_add_success_endpoint(self, client: TestClient) -> None:
-        """Test successful addition operation via endpoint.
+    @pytest.mark.parametrize("operation, a, b", [
+        ("add", "12.75", "8.25"),
+        ("subtract", "15.5", "6.25"),
+        ("multiply", "4.5", "3.2"),
+        ("divide", "15.0", "3.0"),
+    ])
+    def test_calculate_success_endpoint(
+        self, client: TestClient, operation: str, a: str, b: str
+    ) -> None:
+        """Test successful calculation for each operation via endpoint.
         
         Verifies:
         - HTTP status code 200
         - Correct result, operation, and operands in response
-        - Decimal values serialized as strings in JSON
         """
         request_data = {
-            "operation": "add",
-            "a": "12.75",
-            "b": "8.25"
+            "operation": operation,
+            "a": a,
+            "b": b
         }
         
         response = client.post("/calculate", json=request_data)
@@ -58,104 +112,33 @@ class TestCalculateEndpointSuccess:
         assert "operands" in response_data
         
         # Verify calculation correctness
-        expected_result = str(Decimal("12.75") + Decimal("8.25"))
-        assert response_data["result"] == expected_result
-        assert response_data["operation"] == "add"
-        assert response_data["operands"] == ["12.75", "8.25"]
-        
-        # Verify Decimal serialization as strings
-        assert isinstance(response_data["result"], str)
-        assert isinstance(response_data["operands"], list)
-        assert all(isinstance(op, str) for op in response_data["operands"])
-
-    def test_calculate_subtract_success_endpoint(self, client: TestClient) -> None:
-        """Test successful subtraction operation via endpoint.
-        
-        Verifies:
-        - HTTP status code 200
-        - Correct result, operation, and operands in response
-        - Decimal values serialized as strings in JSON
-        """
-        request_data = {
-            "operation": "subtract", 
-            "a": "15.5",
-            "b": "6.25"
-        }
-        
-        response = client.post("/calculate", json=request_data)
-        
-        # Verify response status and structure
-        assert response.status_code == status.HTTP_200_OK
-        response_data = response.json()
-        
-        # Verify calculation correctness
-        expected_result = str(Decimal("15.5") - Decimal("6.25"))
-        assert response_data["result"] == expected_result
-        assert response_data["operation"] == "subtract"
-        assert response_data["operands"] == ["15.5", "6.25"]
-        
-        # Verify Decimal serialization as strings
-        assert isinstance(response_data["result"], str)
-        assert all(isinstance(op, str) for op in response_data["operands"])
-
-    def test_calculate_multiply_success_endpoint(self, client: TestClient) -> None:
-        """Test successful multiplication operation via endpoint.
-        
-        Verifies:
-        - HTTP status code 200
-        - Correct result, operation, and operands in response
-        - Decimal values serialized as strings in JSON
-        """
-        request_data = {
-            "operation": "multiply",
-            "a": "4.5",
-            "b": "3.2"
-        }
-        
-        response = client.post("/calculate", json=request_data)
-        
-        # Verify response status and structure
-        assert response.status_code == status.HTTP_200_OK
-        response_data = response.json()
-        
-        # Verify calculation correctness
-        expected_result = str(Decimal("4.5") * Decimal("3.2"))
+        expected_result = str(_OPERATORS[operation](Decimal(a), Decimal(b)))
         assert response_data["result"] == expected_result
-        assert response_data["operation"] == "multiply"
-        assert response_data["operands"] == ["4.5", "3.2"]
-        
-        # Verify Decimal serialization as strings
-        assert isinstance(response_data["result"], str)
-        assert all(isinstance(op, str) for op in response_data["operands"])
+        assert response_data["operation"] == operation
+        assert response_data["operands"] == [a, b]
 
-    def test_calculate_divide_success_endpoint(self, client: TestClient) -> None:
-        """Test successful division operation via endpoint.
+    def test_response_schema_types(self, client: TestClient) -> None:
+        """Test that the response body matches CalculationResponse with string decimals.
         
         Verifies:
-        - HTTP status code 200
-        - Correct result, operation, and operands in response
+        - Response body validates against CalculationResponse
         - Decimal values serialized as strings in JSON
         """
         request_data = {
-            "operation": "divide",
-            "a": "15.0",
-            "b": "3.0"
+            "operation": "add",
+            "a": "12.75",
+            "b": "8.25"
         }
         
         response = client.post("/calculate", json=request_data)
         
-        # Verify response status and structure
         assert response.status_code == status.HTTP_200_OK
         response_data = response.json()
-        
-        # Verify calculation correctness
-        expected_result = str(Decimal("15.0") / Decimal("3.0"))
-        assert response_data["result"] == expected_result
-        assert response_data["operation"] == "divide"
-        assert response_data["operands"] == ["15.0", "3.0"]
+        CalculationResponse.model_validate(response_data)
         
         # Verify Decimal serialization as strings
         assert isinstance(response_data["result"], str)
+        assert isinstance(response_data["operands"], list)
         assert all(isinstance(op, str) for op in response_data["operands"])
 
 
@@ -182,63 +165,60 @@ class TestCalculateEndpointErrors:
         response_data = response.json()
         assert response_data["detail"] == "Division by zero is not allowed"
 
-    def test_calculate_overflow_add_endpoint(self, client: TestClient) -> None:
-        """Test addition overflow with real operands (not mocked).
-        
-        Uses actual operands that cause overflow: MAX_ABS_OPERAND + 1
+    def test_shared_error_does_not_retain_traceback(self, client: TestClient) -> None:
+        """Test that the shared division-by-zero error drops its traceback once handled.
         
         Verifies:
         - HTTP status code 400
-        - Exact overflow error detail message
+        - DIVISION_BY_ZERO holds no reference to the failed request's frames
+        - An exception it was raised while handling is not retained either
         """
         request_data = {
-            "operation": "add",
-            "a": str(MAX_ABS_OPERAND),
-            "b": "1"
-        }
-        
-        response = client.post("/calculate", json=request_data)
-        
-        # Verify overflow error response
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        response_data = response.json()
-        assert response_data["detail"] == "Calculation result exceeds supported range"
-
-    def test_calculate_overflow_multiply_endpoint(self, client: TestClient) -> None:
-        """Test multiplication overflow with real operands (not mocked).
-        
-        Uses actual operands that cause overflow: MAX_ABS_OPERAND * 1.0000000001
-        
-        Verifies:
-        - HTTP status code 400
-        - Exact overflow error detail message
-        """
-        request_data = {
-            "operation": "multiply",
-            "a": str(MAX_ABS_OPERAND),
-            "b": "1.0000000001"
+            "operation": "divide",
+            "a": "8",
+            "b": "0"
         }
         
         response = client.post("/calculate", json=request_data)
         
-        # Verify overflow error response
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        response_data = response.json()
-        assert response_data["detail"] == "Calculation result exceeds supported range"
+        assert DIVISION_BY_ZERO.__traceback__ is None
+        
+        try:
+            try:
+                raise ValueError("earlier failure")
+            except ValueError as e:
+                raise DIVISION_BY_ZERO.with_traceback(None) from e
+        except DivisionByZeroError as exc:
+            handler = app.exception_handlers[ArithmeticServiceError]
+            asyncio.run(handler(Request({"type": "http"}), exc))
+        
+        assert DIVISION_BY_ZERO.__traceback__ is None
+        assert DIVISION_BY_ZERO.__context__ is None
+        assert DIVISION_BY_ZERO.__cause__ is None
+        assert DIVISION_BY_ZERO.__suppress_context__ is False
 
-    def test_calculate_overflow_divide_endpoint(self, client: TestClient) -> None:
-        """Test division overflow with real operands (not mocked).
-        
-        Uses actual operands that cause overflow: MAX_ABS_OPERAND / 0.9999999999
+    @pytest.mark.parametrize("operation, b", [
+        ("add", "1"),
+        ("multiply", "1.0000000001"),
+        ("divide", "0.9999999999"),
+    ])
+    def test_calculate_overflow_endpoint(
+        self, client: TestClient, operation: str, b: str
+    ) -> None:
+        """Test calculation overflow with real operands (not mocked).
+        
+        Uses MAX_ABS_OPERAND as the first operand with a second operand that
+        pushes the result past the limit: + 1, * 1.0000000001, / 0.9999999999
         
         Verifies:
         - HTTP status code 400
         - Exact overflow error detail message
         """
         request_data = {
-            "operation": "divide",
-            "a": str(MAX_ABS_OPERAND),
-            "b": "0.9999999999"
+            "operation": operation,
+            "a": _MAX_STR,
+            "b": b
         }
         
         response = client.post("/calculate", json=request_data)
@@ -275,12 +255,7 @@ class TestCalculateEndpointErrors:
         assert len(response_data["detail"]) > 0
         
         # Verify the error relates to the operation field
-        operation_error = next(
-            (error for error in response_data["detail"] 
-             if "operation" in str(error.get("loc", []))), 
-            None
-        )
-        assert operation_error is not None
+        assert "operation" in _index_errors(response_data["detail"])
 
     def test_calculate_operand_range_violation_a_too_large_422(self, client: TestClient) -> None:
         """Test operand 'a' exceeding maximum allowed range.
@@ -291,7 +266,7 @@ class TestCalculateEndpointErrors:
         """
         request_data = {
             "operation": "add",
-            "a": str(MAX_ABS_OPERAND + 1),  # Exceeds maximum
+            "a": _OVER_MAX_STR,  # Exceeds maximum
             "b": "1"
         }
         
@@ -306,12 +281,7 @@ class TestCalculateEndpointErrors:
         assert isinstance(response_data["detail"], list)
         
         # Check that error relates to operand 'a'
-        a_error = next(
-            (error for error in response_data["detail"] 
-             if "a" in str(error.get("loc", []))), 
-            None
-        )
-        assert a_error is not None
+        assert "a" in _index_errors(response_data["detail"])
 
     def test_calculate_operand_range_violation_b_too_small_422(self, client: TestClient) -> None:
         """Test operand 'b' below minimum allowed range.
@@ -323,7 +293,7 @@ class TestCalculateEndpointErrors:
         request_data = {
             "operation": "add",
             "a": "1",
-            "b": str(-MAX_ABS_OPERAND - 1)  # Below minimum
+            "b": _UNDER_MIN_STR  # Below minimum
         }
         
         response = client.post("/calculate", json=request_data)
@@ -337,12 +307,7 @@ class TestCalculateEndpointErrors:
         assert isinstance(response_data["detail"], list)
         
         # Check that error relates to operand 'b'
-        b_error = next(
-            (error for error in response_data["detail"] 
-             if "b" in str(error.get("loc", []))), 
-            None
-        )
-        assert b_error is not None
+        assert "b" in _index_errors(response_data["detail"])
 
     def test_calculate_malformed_json_body(self, client: TestClient) -> None:
         """Test malformed JSON request body handling.
@@ -376,83 +341,40 @@ class TestCalculateEndpointErrors:
 class TestCalculateEndpointConcurrency:
     """Test concurrent request handling for the calculate endpoint."""
 
-    def test_calculate_concurrent_requests(self, client: TestClient) -> None:
+    @pytest.mark.asyncio
+    async def test_calculate_concurrent_requests(self) -> None:
         """Test concurrent requests to ensure robust parallel handling.
         
-        Uses ThreadPoolExecutor to simulate multiple concurrent requests
-        across various operations with valid operands.
+        Issues all requests at once as coroutines on a single AsyncClient
+        bound to the app, across various operations with valid operands.
         
         Verifies:
         - All requests are processed correctly and independently
         - No data corruption or unexpected errors occur
         - Each response is validated for correctness
         """
-        def make_request(request_data: Dict[str, Any]) -> Dict[str, Any]:
-            """Make a single request and return response data with request info.
-            
-            Args:
-                request_data: The request payload
-                
-            Returns:
-                Dict containing response data and original request for validation
-            """
-            response = client.post("/calculate", json=request_data)
-            return {
-                "status_code": response.status_code,
-                "response_data": response.json(),
-                "request_data": request_data
-            }
-        
-        # Define various test scenarios for concurrent execution
-        test_scenarios = [
-            {"operation": "add", "a": "10.5", "b": "5.25"},
-            {"operation": "subtract", "a": "20.0", "b": "8.5"},
-            {"operation": "multiply", "a": "3.5", "b": "4.0"},
-            {"operation": "divide", "a": "15.0", "b": "3.0"},
-            {"operation": "add", "a": "100.123", "b": "200.456"},
-            {"operation": "subtract", "a": "500.0", "b": "250.75"},
-            {"operation": "multiply", "a": "7.5", "b": "8.0"},
-            {"operation": "divide", "a": "24.0", "b": "6.0"},
-            {"operation": "add", "a": "0.1", "b": "0.2"},
-            {"operation": "subtract", "a": "1.0", "b": "0.9"},
-            {"operation": "multiply", "a": "12.5", "b": "2.5"},
-            {"operation": "divide", "a": "50.0", "b": "10.0"},
-            {"operation": "add", "a": "-5.5", "b": "3.25"},
-            {"operation": "subtract", "a": "-10.0", "b": "-5.0"},
-            {"operation": "multiply", "a": "-2.5", "b": "4.0"},
-            {"operation": "divide", "a": "-20.0", "b": "-4.0"},
-            {"operation": "add", "a": "999.999", "b": "0.001"},
-            {"operation": "subtract", "a": "1000.0", "b": "999.999"},
-            {"operation": "multiply", "a": "1.5", "b": "1.5"},
-            {"operation": "divide", "a": "9.0", "b": "3.0"}
+        # Expected result strings, computed once before dispatching requests
+        expected_results = [
+            str(_OPERATORS[s["operation"]](Decimal(s["a"]), Decimal(s["b"])))
+            for s in _SCENARIOS
         ]
         
-        # Execute requests concurrently using ThreadPoolExecutor
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-            # Submit all requests concurrently
-            future_to_request = {
-                executor.submit(make_request, scenario): scenario 
-                for scenario in test_scenarios
-            }
-            
-            # Collect results as they complete
-            results = []
-            for future in concurrent.futures.as_completed(future_to_request):
-                original_request = future_to_request[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as exc:
-                    pytest.fail(f"Request {original_request} generated exception: {exc}")
+        # Execute requests concurrently on the app's event loop
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            responses = await asyncio.gather(
+                *(ac.post("/calculate", json=scenario) for scenario in _SCENARIOS)
+            )
         
         # Verify all requests completed successfully
-        assert len(results) == len(test_scenarios)
-        
-        # Validate each result individually
-        for result in results:
-            status_code = result["status_code"]
-            response_data = result["response_data"]
-            request_data = result["request_data"]
+        assert len(responses) == len(_SCENARIOS)
+        
+        # Validate each response against the request that produced it
+        for request_data, expected_result, response in zip(
+            _SCENARIOS, expected_results, responses
+        ):
+            status_code = response.status_code
+            response_data = response.json()
             
             # All test scenarios should succeed (no division by zero or overflow)
             assert status_code == status.HTTP_200_OK, f"Request {request_data} failed with status {status_code}"
@@ -469,26 +391,8 @@ class TestCalculateEndpointConcurrency:
             expected_operands = [request_data["a"], request_data["b"]]
             assert response_data["operands"] == expected_operands
             
-            # Verify result is a string (Decimal serialization)
-            assert isinstance(response_data["result"], str)
-            
-            # Verify calculation correctness by recomputing expected result
-            a = Decimal(request_data["a"])
-            b = Decimal(request_data["b"])
-            operation = request_data["operation"]
-            
-            if operation == "add":
-                expected_result = str(a + b)
-            elif operation == "subtract":
-                expected_result = str(a - b)
-            elif operation == "multiply":
-                expected_result = str(a * b)
-            elif operation == "divide":
-                expected_result = str(a / b)
-            else:
-                pytest.fail(f"Unexpected operation: {operation}")
-            
+            # Verify calculation correctness against the precomputed result
             assert response_data["result"] == expected_result, (
-                f"Incorrect result for {operation}({a}, {b}): "
+                f"Incorrect result for {request_data}: "
                 f"expected {expected_result}, got {response_data['result']}"
             )
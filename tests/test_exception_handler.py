@@ -1,9 +1,13 @@
 """Integration tests for the FastAPI exception handler."""
 
+import functools
+from typing import Callable
+
 import pytest
-from fastapi import status
+from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
 
+from ts_arithmetic_svc.app import arithmetic_service_error_handler
 from ts_arithmetic_svc.exceptions import (
     ArithmeticServiceError,
     DivisionByZeroError,
@@ -12,17 +16,36 @@ from ts_arithmetic_svc.exceptions import (
 )
 
 
+async def _raise(exc_factory: Callable[[], ArithmeticServiceError]) -> None:
+    """Route endpoint that raises the exception built by exc_factory."""
+    raise exc_factory()
+
+
+@pytest.fixture
+def mini_app() -> FastAPI:
+    """Fresh FastAPI app with the service's ArithmeticServiceError handler registered."""
+    app = FastAPI()
+    app.add_exception_handler(ArithmeticServiceError, arithmetic_service_error_handler)
+    return app
+
+
+@pytest.fixture
+def mini_client(mini_app: FastAPI) -> TestClient:
+    """TestClient bound to the mini_app fixture."""
+    return TestClient(mini_app)
+
+
 class TestExceptionHandlerIntegration:
     """Integration tests for exception handler behavior in FastAPI app."""
 
-    def test_arithmetic_service_error_response_format(self, client: TestClient) -> None:
+    def test_arithmetic_service_error_response_format(self, mini_app: FastAPI, mini_client: TestClient) -> None:
         """Test that exception handler returns properly formatted JSON response.
         
         Args:
-            client: TestClient fixture from conftest.py
+            mini_app: Fresh FastAPI app with the exception handler registered
+            mini_client: TestClient bound to mini_app
         """
         from fastapi import APIRouter
-        from ts_arithmetic_svc.app import app
         
         # Create test route
         test_router = APIRouter()
@@ -34,9 +57,9 @@ class TestExceptionHandlerIntegration:
                 status_code=status.HTTP_400_BAD_REQUEST
             )
         
-        app.include_router(test_router)
+        mini_app.include_router(test_router)
         
-        response = client.get("/test-error-format")
+        response = mini_client.get("/test-error-format")
         
         # Verify response structure
         assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -50,14 +73,14 @@ class TestExceptionHandlerIntegration:
         # Verify response has correct content type
         assert "application/json" in response.headers["content-type"]
 
-    def test_all_exception_types_handled_consistently(self, client: TestClient) -> None:
+    def test_all_exception_types_handled_consistently(self, mini_app: FastAPI, mini_client: TestClient) -> None:
         """Test that all exception types are handled with consistent format.
         
         Args:
-            client: TestClient fixture from conftest.py
+            mini_app: Fresh FastAPI app with the exception handler registered
+            mini_client: TestClient bound to mini_app
         """
         from fastapi import APIRouter
-        from ts_arithmetic_svc.app import app
         
         exception_test_cases = [
             ("division-by-zero", DivisionByZeroError, "Division by zero is not allowed"),
@@ -69,22 +92,17 @@ class TestExceptionHandlerIntegration:
         
         # Create test routes for each exception type
         for route_name, exception_class, expected_detail in exception_test_cases:
-            def create_handler(exc_class):
-                async def handler():
-                    raise exc_class()
-                return handler
-            
             test_router.add_api_route(
                 f"/test-{route_name}",
-                create_handler(exception_class),
+                functools.partial(_raise, exception_class),
                 methods=["GET"]
             )
         
-        app.include_router(test_router)
+        mini_app.include_router(test_router)
         
         # Test each exception type
         for route_name, exception_class, expected_detail in exception_test_cases:
-            response = client.get(f"/test-{route_name}")
+            response = mini_client.get(f"/test-{route_name}")
             
             # Verify consistent response format
             assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -94,14 +112,14 @@ class TestExceptionHandlerIntegration:
             assert "detail" in response_data
             assert response_data["detail"] == expected_detail
 
-    def test_exception_handler_preserves_custom_status_codes(self, client: TestClient) -> None:
+    def test_exception_handler_preserves_custom_status_codes(self, mini_app: FastAPI, mini_client: TestClient) -> None:
         """Test that custom status codes are preserved by the exception handler.
         
         Args:
-            client: TestClient fixture from conftest.py
+            mini_app: Fresh FastAPI app with the exception handler registered
+            mini_client: TestClient bound to mini_app
         """
         from fastapi import APIRouter
-        from ts_arithmetic_svc.app import app
         
         test_router = APIRouter()
         
@@ -112,38 +130,35 @@ class TestExceptionHandlerIntegration:
         ]
         
         for i, custom_status in enumerate(custom_status_codes):
-            def create_handler(status_code):
-                async def handler():
-                    raise ArithmeticServiceError(
-                        detail=f"Error with status {status_code}",
-                        status_code=status_code
-                    )
-                return handler
-            
+            exc_factory = functools.partial(
+                ArithmeticServiceError,
+                detail=f"Error with status {custom_status}",
+                status_code=custom_status
+            )
             test_router.add_api_route(
                 f"/test-status-{i}",
-                create_handler(custom_status),
+                functools.partial(_raise, exc_factory),
                 methods=["GET"]
             )
         
-        app.include_router(test_router)
+        mini_app.include_router(test_router)
         
         for i, expected_status in enumerate(custom_status_codes):
-            response = client.get(f"/test-status-{i}")
+            response = mini_client.get(f"/test-status-{i}")
             
             # Verify custom status code is preserved
             assert response.status_code == expected_status
             response_data = response.json()
             assert response_data["detail"] == f"Error with status {expected_status}"
 
-    def test_exception_handler_does_not_affect_other_http_exceptions(self, client: TestClient) -> None:
+    def test_exception_handler_does_not_affect_other_http_exceptions(self, mini_app: FastAPI, mini_client: TestClient) -> None:
         """Test that the handler only affects ArithmeticServiceError and its subclasses.
         
         Args:
-            client: TestClient fixture from conftest.py
+            mini_app: Fresh FastAPI app with the exception handler registered
+            mini_client: TestClient bound to mini_app
         """
         from fastapi import APIRouter, HTTPException
-        from ts_arithmetic_svc.app import app
         
         test_router = APIRouter()
         
@@ -155,21 +170,21 @@ class TestExceptionHandlerIntegration:
                 detail="Regular HTTP exception"
             )
         
-        app.include_router(test_router)
+        mini_app.include_router(test_router)
         
         # Test regular HTTPException - should work normally
-        response = client.get("/test-http-exception")
+        response = mini_client.get("/test-http-exception")
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert response.json()["detail"] == "Regular HTTP exception"
 
-    def test_exception_handler_with_none_detail(self, client: TestClient) -> None:
+    def test_exception_handler_with_none_detail(self, mini_app: FastAPI, mini_client: TestClient) -> None:
         """Test exception handler behavior when detail is None.
         
         Args:
-            client: TestClient fixture from conftest.py
+            mini_app: Fresh FastAPI app with the exception handler registered
+            mini_client: TestClient bound to mini_app
         """
         from fastapi import APIRouter
-        from ts_arithmetic_svc.app import app
         
         test_router = APIRouter()
         
@@ -178,9 +193,9 @@ class TestExceptionHandlerIntegration:
             # Create exception with None detail (should use class default)
             raise ArithmeticServiceError(detail=None)
         
-        app.include_router(test_router)
+        mini_app.include_router(test_router)
         
-        response = client.get("/test-none-detail")
+        response = mini_client.get("/test-none-detail")
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         response_data = response.json()
@@ -1,10 +1,13 @@
 """Unit tests for custom arithmetic service exceptions."""
 
+from collections.abc import Iterator
+
 import pytest
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.testclient import TestClient
 
+from ts_arithmetic_svc import exceptions
 from ts_arithmetic_svc.exceptions import (
     ArithmeticServiceError,
     DivisionByZeroError,
@@ -12,6 +15,23 @@ from ts_arithmetic_svc.exceptions import (
     UnsupportedOperationError
 )
 
+# Each ArithmeticServiceError subclass with its default detail message
+EXC_CASES = [
+    (DivisionByZeroError, "Division by zero is not allowed"),
+    (CalculationOverflowError, "Calculation result exceeds supported range"),
+    (UnsupportedOperationError, "Unsupported operation"),
+]
+EXC_IDS = ["divzero", "overflow", "unsupported"]
+
+
+@pytest.fixture(scope="module", params=EXC_CASES, ids=EXC_IDS)
+def default_exc(
+    request: pytest.FixtureRequest
+) -> tuple[type[ArithmeticServiceError], str, ArithmeticServiceError]:
+    """Each exception subclass with its default detail and one default instance."""
+    exc_cls, detail = request.param
+    return exc_cls, detail, exc_cls()
+
 
 class TestArithmeticServiceError:
     """Test cases for the base ArithmeticServiceError class."""
@@ -71,89 +91,37 @@ class TestArithmeticServiceError:
         assert isinstance(exc, HTTPException)
 
 
-class TestDivisionByZeroError:
-    """Test cases for DivisionByZeroError."""
-
-    def test_default_initialization(self) -> None:
-        """Test DivisionByZeroError with default values."""
-        exc = DivisionByZeroError()
-        assert exc.status_code == status.HTTP_400_BAD_REQUEST
-        assert exc.detail == "Division by zero is not allowed"
-        assert exc.headers is None
-
-    def test_custom_detail_override(self) -> None:
-        """Test DivisionByZeroError with custom detail message."""
-        custom_detail = "Custom division by zero error"
-        exc = DivisionByZeroError(detail=custom_detail)
-        assert exc.status_code == status.HTTP_400_BAD_REQUEST
-        assert exc.detail == custom_detail
-
-    def test_inheritance(self) -> None:
-        """Test that DivisionByZeroError inherits from ArithmeticServiceError."""
-        exc = DivisionByZeroError()
-        assert isinstance(exc, ArithmeticServiceError)
-        assert isinstance(exc, type(ArithmeticServiceError()))
-
-    def test_class_attributes(self) -> None:
-        """Test that class attributes are set correctly."""
-        assert DivisionByZeroError.status_code == status.HTTP_400_BAD_REQUEST
-        assert DivisionByZeroError.detail == "Division by zero is not allowed"
-
-
-class TestCalculationOverflowError:
-    """Test cases for CalculationOverflowError."""
+class TestArithmeticServiceErrorSubclasses:
+    """Test cases shared by every ArithmeticServiceError subclass."""
 
-    def test_default_initialization(self) -> None:
-        """Test CalculationOverflowError with default values."""
-        exc = CalculationOverflowError()
+    def test_defaults(
+        self, default_exc: tuple[type[ArithmeticServiceError], str, ArithmeticServiceError]
+    ) -> None:
+        """Test subclass defaults and inheritance on a default-constructed instance."""
+        _, detail, exc = default_exc
         assert exc.status_code == status.HTTP_400_BAD_REQUEST
-        assert exc.detail == "Calculation result exceeds supported range"
+        assert exc.detail == detail
         assert exc.headers is None
-
-    def test_custom_detail_override(self) -> None:
-        """Test CalculationOverflowError with custom detail message."""
-        custom_detail = "Custom overflow error"
-        exc = CalculationOverflowError(detail=custom_detail)
-        assert exc.status_code == status.HTTP_400_BAD_REQUEST
-        assert exc.detail == custom_detail
-
-    def test_inheritance(self) -> None:
-        """Test that CalculationOverflowError inherits from ArithmeticServiceError."""
-        exc = CalculationOverflowError()
         assert isinstance(exc, ArithmeticServiceError)
 
-    def test_class_attributes(self) -> None:
-        """Test that class attributes are set correctly."""
-        assert CalculationOverflowError.status_code == status.HTTP_400_BAD_REQUEST
-        assert CalculationOverflowError.detail == "Calculation result exceeds supported range"
-
-
-class TestUnsupportedOperationError:
-    """Test cases for UnsupportedOperationError."""
-
-    def test_default_initialization(self) -> None:
-        """Test UnsupportedOperationError with default values."""
-        exc = UnsupportedOperationError()
-        assert exc.status_code == status.HTTP_400_BAD_REQUEST
-        assert exc.detail == "Unsupported operation"
-        assert exc.headers is None
-
-    def test_custom_detail_override(self) -> None:
-        """Test UnsupportedOperationError with custom detail message."""
-        custom_detail = "Custom unsupported operation error"
-        exc = UnsupportedOperationError(detail=custom_detail)
+    @pytest.mark.parametrize("exc_cls, detail", EXC_CASES, ids=EXC_IDS)
+    def test_custom_detail_override(
+        self, exc_cls: type[ArithmeticServiceError], detail: str
+    ) -> None:
+        """Test subclass initialization with a custom detail message."""
+        custom_detail = f"Custom {exc_cls.__name__} message"
+        exc = exc_cls(detail=custom_detail)
         assert exc.status_code == status.HTTP_400_BAD_REQUEST
         assert exc.detail == custom_detail
+        assert exc.detail != detail
 
-    def test_inheritance(self) -> None:
-        """Test that UnsupportedOperationError inherits from ArithmeticServiceError."""
-        exc = UnsupportedOperationError()
-        assert isinstance(exc, ArithmeticServiceError)
-
-    def test_class_attributes(self) -> None:
+    @pytest.mark.parametrize("exc_cls, detail", EXC_CASES, ids=EXC_IDS)
+    def test_class_attributes(
+        self, exc_cls: type[ArithmeticServiceError], detail: str
+    ) -> None:
         """Test that class attributes are set correctly."""
-        assert UnsupportedOperationError.status_code == status.HTTP_400_BAD_REQUEST
-        assert UnsupportedOperationError.detail == "Unsupported operation"
+        assert exc_cls.status_code == status.HTTP_400_BAD_REQUEST
+        assert exc_cls.detail == detail
 
 
 class TestExceptionModuleExports:
@@ -161,24 +129,34 @@ class TestExceptionModuleExports:
 
     def test_module_exports_all_exceptions(self) -> None:
         """Test that the exceptions module exports all expected exception classes."""
-        from ts_arithmetic_svc import exceptions
-        
-        expected_exports = {
+        expected_classes = {
             "ArithmeticServiceError",
             "DivisionByZeroError", 
             "CalculationOverflowError",
             "UnsupportedOperationError"
         }
+        expected_instances = {"DIVISION_BY_ZERO", "OVERFLOW"}
+        module_vars = vars(exceptions)
         
-        # Check that __all__ is defined and contains expected items
-        assert hasattr(exceptions, '__all__')
-        assert set(exceptions.__all__) == expected_exports
+        # Check that __all__ contains exactly the expected items
+        assert set(exceptions.__all__) == expected_classes | expected_instances
         
         # Check that all items in __all__ are actually accessible
-        for export_name in exceptions.__all__:
-            assert hasattr(exceptions, export_name)
-            export_class = getattr(exceptions, export_name)
-            assert callable(export_class)  # Should be a class (callable)
+        assert not (expected_classes | expected_instances) - module_vars.keys()
+        assert all(callable(module_vars[name]) for name in expected_classes)
+        assert all(
+            isinstance(module_vars[name], ArithmeticServiceError)
+            for name in expected_instances
+        )
+
+    def test_shared_instances_use_default_details(self) -> None:
+        """Test that the shared exception instances carry the class defaults."""
+        from ts_arithmetic_svc.exceptions import DIVISION_BY_ZERO, OVERFLOW
+        
+        assert isinstance(DIVISION_BY_ZERO, DivisionByZeroError)
+        assert DIVISION_BY_ZERO.detail == DivisionByZeroError.detail
+        assert isinstance(OVERFLOW, CalculationOverflowError)
+        assert OVERFLOW.detail == CalculationOverflowError.detail
 
 
 # Self-contained temporary FastAPI app for integration testing
@@ -225,6 +203,21 @@ async def handle_exception_route(exception_type: str) -> dict[str, str]:
     return {"message": "No exception raised"}
 
 
+# Path segment for each exception raised by test_app, with its expected detail
+HANDLER_CASES = [
+    ("division_by_zero", "Division by zero is not allowed"),
+    ("overflow", "Calculation result exceeds supported range"),
+    ("unsupported", "Unsupported operation"),
+]
+
+
+@pytest.fixture(scope="module")
+def test_client() -> Iterator[TestClient]:
+    """TestClient for the temporary FastAPI app, shared by the tests in this module."""
+    with TestClient(test_app) as client:
+        yield client
+
+
 class TestFastAPIExceptionHandlerIntegration:
     """Integration tests using self-contained temporary FastAPI app.
     
@@ -232,89 +225,91 @@ class TestFastAPIExceptionHandlerIntegration:
     rather than the global app and client fixture.
     """
 
-    def test_division_by_zero_error_integration(self) -> None:
+    def test_division_by_zero_error_integration(self, test_client: TestClient) -> None:
         """Test that DivisionByZeroError is handled correctly by FastAPI.
         
-        Uses self-contained TestClient with temporary FastAPI app as required.
+        Args:
+            test_client: TestClient bound to the module's temporary FastAPI app
         """
-        with TestClient(test_app) as client:
-            response = client.get("/test-exception/division_by_zero")
-            
-            assert response.status_code == 400
-            response_data = response.json()
-            assert response_data == {"detail": "Division by zero is not allowed"}
-
-    def test_calculation_overflow_error_integration(self) -> None:
+        response = test_client.get("/test-exception/division_by_zero")
+        
+        assert response.status_code == 400
+        assert response.content == b'{"detail":"Division by zero is not allowed"}'
+
+    def test_calculation_overflow_error_integration(self, test_client: TestClient) -> None:
         """Test that CalculationOverflowError is handled correctly by FastAPI.
         
-        Uses self-contained TestClient with temporary FastAPI app as required.
+        Args:
+            test_client: TestClient bound to the module's temporary FastAPI app
         """
-        with TestClient(test_app) as client:
-            response = client.get("/test-exception/overflow")
-            
-            assert response.status_code == 400
-            response_data = response.json()
-            assert response_data == {"detail": "Calculation result exceeds supported range"}
-
-    def test_unsupported_operation_error_integration(self) -> None:
+        response = test_client.get("/test-exception/overflow")
+        
+        assert response.status_code == 400
+        assert response.content == b'{"detail":"Calculation result exceeds supported range"}'
+
+    def test_unsupported_operation_error_integration(self, test_client: TestClient) -> None:
         """Test that UnsupportedOperationError is handled correctly by FastAPI.
         
-        Uses self-contained TestClient with temporary FastAPI app as required.
+        Args:
+            test_client: TestClient bound to the module's temporary FastAPI app
         """
-        with TestClient(test_app) as client:
-            response = client.get("/test-exception/unsupported")
-            
-            assert response.status_code == 400
-            response_data = response.json()
-            assert response_data == {"detail": "Unsupported operation"}
-
-    def test_no_exception_raised_returns_success(self) -> None:
+        response = test_client.get("/test-exception/unsupported")
+        
+        assert response.status_code == 400
+        assert response.content == b'{"detail":"Unsupported operation"}'
+
+    def test_no_exception_raised_returns_success(self, test_client: TestClient) -> None:
         """Test that route returns success message when no exception is raised.
         
-        Uses self-contained TestClient with temporary FastAPI app as required.
+        Args:
+            test_client: TestClient bound to the module's temporary FastAPI app
         """
-        with TestClient(test_app) as client:
-            response = client.get("/test-exception/no_error")
-            
-            assert response.status_code == 200
-            response_data = response.json()
-            assert response_data == {"message": "No exception raised"}
-
-    def test_exception_handler_response_format(self) -> None:
+        response = test_client.get("/test-exception/no_error")
+        
+        assert response.status_code == 200
+        response_data = response.json()
+        assert response_data == {"message": "No exception raised"}
+
+    @pytest.mark.parametrize("exception_type, expected_detail", HANDLER_CASES)
+    def test_exception_handler_response_format(
+        self, test_client: TestClient, exception_type: str, expected_detail: str
+    ) -> None:
         """Test that exception handler returns properly formatted JSON response.
         
-        Uses self-contained TestClient with temporary FastAPI app as required.
+        Args:
+            test_client: TestClient bound to the module's temporary FastAPI app
+            exception_type: Path segment selecting the exception to raise
+            expected_detail: Detail message the exception carries
+        """
+        response = test_client.get(f"/test-exception/{exception_type}")
+        
+        # Verify response structure and content
+        assert response.status_code == 400
+        response_data = response.json()
+        assert isinstance(response_data, dict)
+        assert "detail" in response_data
+        assert response_data["detail"] == expected_detail
+
+    def test_handler_returns_json_content_type(self, test_client: TestClient) -> None:
+        """Test that exception handler responses are served as JSON.
+        
+        Args:
+            test_client: TestClient bound to the module's temporary FastAPI app
         """
-        with TestClient(test_app) as client:
-            # Test all exception types to verify consistent formatting
-            test_cases = [
-                ("division_by_zero", "Division by zero is not allowed"),
-                ("overflow", "Calculation result exceeds supported range"),
-                ("unsupported", "Unsupported operation")
-            ]
-            
-            for exception_type, expected_detail in test_cases:
-                response = client.get(f"/test-exception/{exception_type}")
-                
-                # Verify response structure and content
-                assert response.status_code == 400
-                response_data = response.json()
-                assert isinstance(response_data, dict)
-                assert "detail" in response_data
-                assert response_data["detail"] == expected_detail
-                
-                # Verify response has correct content type
-                assert "application/json" in response.headers["content-type"]
-
-    def test_exception_handler_preserves_status_codes(self) -> None:
+        response = test_client.get("/test-exception/division_by_zero")
+        
+        assert "application/json" in response.headers["content-type"]
+
+    @pytest.mark.parametrize("exception_type", [case[0] for case in HANDLER_CASES])
+    def test_exception_handler_preserves_status_codes(
+        self, test_client: TestClient, exception_type: str
+    ) -> None:
         """Test that exception handler preserves the status_code from exceptions.
         
-        Uses self-contained TestClient with temporary FastAPI app as required.
+        Args:
+            test_client: TestClient bound to the module's temporary FastAPI app
+            exception_type: Path segment selecting the exception to raise
         """
-        with TestClient(test_app) as client:
-            # All our custom exceptions use HTTP 400 by default
-            exception_types = ["division_by_zero", "overflow", "unsupported"]
-            
-            for exception_type in exception_types:
-                response = client.get(f"/test-exception/{exception_type}")
-                assert response.status_code == 400
+        # All our custom exceptions use HTTP 400 by default
+        response = test_client.get(f"/test-exception/{exception_type}")
+        assert response.status_code == 400